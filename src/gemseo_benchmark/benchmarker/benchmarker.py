@@ -122,7 +122,7 @@ class Benchmarker:
 
             self.__disable_stopping_criteria(algorithm_configuration)
             for problem in problems:
-                for problem_instance_index, problem_instance in enumerate(problem):
+                for problem_instance_index in range(len(problem.start_points)):
                     if self.__skip_instance(
                         algorithm_configuration,
                         problem,
@@ -147,7 +147,7 @@ class Benchmarker:
                             problem_instance_index,
                         ),
                         problem,
-                        problem_instance,
+                        problem.create_instance(problem_instance_index),
                         problem_instance_index,
                         log_path,
                     ))
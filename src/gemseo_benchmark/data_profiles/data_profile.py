@@ -45,7 +45,9 @@ import matplotlib
 import matplotlib.pyplot as plt
 from gemseo.utils.constants import READ_ONLY_EMPTY_DICT
 from gemseo.utils.matplotlib_figure import save_show_figure
-from numpy import array
+from numpy import arange
+from numpy import asarray
+from numpy import full
 from numpy import linspace
 from numpy import ndarray
 from numpy import zeros
@@ -80,6 +82,7 @@ class DataProfile:
         self.__targets_number = 0
         self.target_values = target_values
         self.__values_histories = {}
+        self.__max_history_sizes = {}
 
     @property
     def target_values(self) -> dict[str, TargetValues]:
@@ -103,13 +106,17 @@ class DataProfile:
             msg = "The target values be must passed as a mapping"
             raise TypeError(msg)
 
-        targets_numbers = {len(pb_targets) for pb_targets in target_values.values()}
-        if len(targets_numbers) != 1:
+        targets_numbers = (len(pb_targets) for pb_targets in target_values.values())
+        targets_number = next(targets_numbers, None)
+        if targets_number is None or any(
+            number != targets_number for number in targets_numbers
+        ):
             msg = "The reference problems must have the same number of target values."
             raise ValueError(msg)
 
         self.__target_values = dict(target_values)
-        self.__targets_number = targets_numbers.pop()
+        self.__targets_number = targets_number
+        self.__data_profiles = {}
 
     def add_history(
         self,
@@ -149,6 +156,10 @@ class DataProfile:
         self.__values_histories[algorithm_configuration_name][problem_name].append(
             history
         )
+        self.__max_history_sizes[algorithm_configuration_name] = max(
+            self.__max_history_sizes.get(algorithm_configuration_name, 0), len(history)
+        )
+        self.__data_profiles.pop(algorithm_configuration_name, None)
 
     def plot(
         self,
@@ -176,7 +187,7 @@ class DataProfile:
         if algo_names is None:
             algo_names = ()
 
-        data_profiles = self.compute_data_profiles(*algo_names)
+        data_profiles = self.__get_data_profiles(*algo_names)
         figure = self._plot_data_profiles(
             data_profiles, markevery, plot_kwargs, grid_kwargs
         )
@@ -187,6 +198,8 @@ class DataProfile:
 
         For each algorithm, compute the cumulative distribution function of the number
         of evaluations required by the algorithm to reach a reference target.
+        The data profile of an algorithm is computed again
+        only if a history has been added for this algorithm since its last computation.
 
         Args:
             algo_names: The names of the algorithms.
@@ -195,18 +208,33 @@ class DataProfile:
         Returns:
             The data profiles.
         """
-        data_profiles = {}
+        return {
+            name: profile.tolist()
+            for name, profile in self.__get_data_profiles(*algo_names).items()
+        }
+
+    def __get_data_profiles(self, *algo_names: str) -> dict[str, ndarray]:
+        """Return the data profiles of the required algorithms.
+
+        Args:
+            algo_names: The names of the algorithms.
+                If empty then all the algorithms are considered.
+
+        Returns:
+            The data profiles, which must not be modified.
+        """
         if not algo_names:
-            algo_names = self.__values_histories.keys()
+            algo_names = tuple(self.__values_histories)
 
         for name in algo_names:
-            total_hits_history = self.__compute_hits_history(name)
-            problems_number = len(self.__target_values)
-            repeat_number = self.__get_repeat_number(name)
-            targets_total = self.__targets_number * problems_number * repeat_number
-            ratios = total_hits_history / targets_total
-            data_profiles[name] = ratios.tolist()
-        return data_profiles
+            if name not in self.__data_profiles:
+                total_hits_history = self.__compute_hits_history(name)
+                problems_number = len(self.__target_values)
+                repeat_number = self.__get_repeat_number(name)
+                targets_total = self.__targets_number * problems_number * repeat_number
+                self.__data_profiles[name] = total_hits_history / targets_total
+
+        return {name: self.__data_profiles[name] for name in algo_names}
 
     def __compute_hits_history(self, algo_name: str) -> ndarray:
         """Compute the history of the number of target hits of an algorithm.
@@ -219,23 +247,14 @@ class DataProfile:
         """
         algo_histories = self.__values_histories[algo_name]
 
-        # Compute the maximal size of an optimization history
-        max_history_size = max(
-            max(len(pb_history) for pb_history in algo_history)
-            for algo_history in algo_histories.values()
-        )
-
         # Compute the history of the number of target hits across all optimizations
-        total_hits_history = zeros(max_history_size)
+        total_hits_history = zeros(self.__max_history_sizes[algo_name], dtype=int)
         for pb_name, targets in self.__target_values.items():
             for pb_history in algo_histories[pb_name]:
-                hits_history = targets.compute_target_hits_history(pb_history)
+                hits_history = asarray(targets.compute_target_hits_history(pb_history))
+                total_hits_history[: hits_history.size] += hits_history
                 # If the history is shorter than the longest one, repeat its last value
-                if len(hits_history) < max_history_size:
-                    tail = [hits_history[-1]] * (max_history_size - len(hits_history))
-                    hits_history.extend(tail)
-
-                total_hits_history += array(hits_history)
+                total_hits_history[hits_history.size :] += hits_history[-1]
 
         return total_hits_history
 
@@ -255,15 +274,18 @@ class DataProfile:
             ValueError: If the algorithm does not have the same number of histories
                 for each problem.
         """
-        histories_numbers = {
+        histories_numbers = (
             len(histories) for histories in self.__values_histories[algo_name].values()
-        }
-        if len(histories_numbers) != 1:
+        )
+        histories_number = next(histories_numbers, None)
+        if histories_number is None or any(
+            number != histories_number for number in histories_numbers
+        ):
             msg = (
                 f"Reference problems unequally represented for algorithm {algo_name!r}."
             )
             raise ValueError(msg)
-        return histories_numbers.pop()
+        return histories_number
 
     @staticmethod
     def _plot_data_profiles(
@@ -295,19 +317,20 @@ class DataProfile:
         axes.set_title(f"Data profile{'s' if len(data_profiles) > 1 else ''}")
         max_profile_size = max(len(profile) for profile in data_profiles.values())
         axes.xaxis.set_major_locator(matplotlib.ticker.MaxNLocator(integer=True))
-        plt.xlabel("Number of functions evaluations")
-        plt.xlim([1, max_profile_size])
+        axes.set_xlabel("Number of functions evaluations")
+        axes.set_xlim([1, max_profile_size])
         y_ticks = linspace(0.0, 1.0, 11)
-        plt.yticks(y_ticks, (f"{ratio * 100.0:.0f}%" for ratio in y_ticks))
-        plt.ylabel("Ratios of targets reached")
-        plt.ylim([0.0, 1.05])
+        axes.set_yticks(y_ticks, [f"{ratio * 100.0:.0f}%" for ratio in y_ticks])
+        axes.set_ylabel("Ratios of targets reached")
+        axes.set_ylim([0.0, 1.05])
 
         # Plot the data profiles
+        evaluations_numbers = arange(1, max_profile_size + 1)
         for name, profile in data_profiles.items():
             # Plot the data profile
             profile_size = len(profile)
             axes.plot(
-                range(1, profile_size + 1),
+                evaluations_numbers[:profile_size],
                 profile,
                 markevery=markevery,
                 **plot_kwargs[name],
@@ -319,14 +342,14 @@ class DataProfile:
                 tail_size = max_profile_size - profile_size + 1
                 last_value = profile[-1]
                 axes.plot(
-                    range(profile_size, profile_size + tail_size),
-                    [last_value] * tail_size,
+                    evaluations_numbers[profile_size - 1 :],
+                    full(tail_size, last_value),
                     color=color,
                     linestyle="dotted",
                 )
                 # Mark the last entry of the data profile
                 axes.plot(profile_size, last_value, marker="*", color=color)
 
-        plt.legend()
-        plt.grid(**grid_kwargs)
+        axes.legend()
+        axes.grid(**grid_kwargs)
         return fig
@@ -35,6 +35,7 @@ from typing import TYPE_CHECKING
 import matplotlib
 import matplotlib.pyplot as plt
 from gemseo.utils.matplotlib_figure import save_show_figure
+from numpy import arange
 from numpy import array
 from numpy import linspace
 from numpy import logical_not
@@ -62,11 +63,12 @@ class TargetValues(PerformanceHistory):
         Returns:
             The history of the number of target hits.
         """
-        minimum_history = values_history.compute_cumulated_minimum()
-        return [
-            [minimum <= target for target in self].count(True)
-            for minimum in minimum_history
-        ]
+        return (
+            values_history.compute_cumulated_minimum()
+            .is_lower_or_equal(self)
+            .sum(axis=1)
+            .tolist()
+        )
 
     def plot(self, show: bool = True, file_path: str | Path | None = None) -> Figure:
         """Plot the target values.
@@ -83,19 +85,19 @@ class TargetValues(PerformanceHistory):
         fig = plt.figure()
         axes = fig.add_subplot(1, 1, 1)
         axes.set_title("Target values")
-        plt.xlabel("Target index")
-        plt.xlim([0, targets_number + 1])
-        plt.xticks(linspace(1, targets_number, dtype=int))
-        plt.ylabel("Target value")
-        indexes, history_items = self.get_plot_data()
+        axes.set_xlabel("Target index")
+        axes.set_xlim([0, targets_number + 1])
+        axes.set_xticks(linspace(1, targets_number, dtype=int))
+        axes.set_ylabel("Target value")
+        indexes = arange(1, targets_number + 1)
+        objective_values = array(self.objective_values)
+        is_feasible = array(self.infeasibility_measures) == 0.0
 
         # Plot the feasible target values
-        objective_values = [item.objective_value for item in history_items]
-        is_feasible = array([item.is_feasible for item in history_items])
         if is_feasible.any():
             axes.plot(
-                array(indexes)[is_feasible],
-                array(objective_values)[is_feasible],
+                indexes[is_feasible],
+                objective_values[is_feasible],
                 color="black",
                 marker="o",
                 linestyle="",
@@ -106,15 +108,15 @@ class TargetValues(PerformanceHistory):
         is_infeasible = logical_not(is_feasible)
         if is_infeasible.any():
             axes.plot(
-                array(indexes)[is_infeasible],
-                array(objective_values)[is_infeasible],
+                indexes[is_infeasible],
+                objective_values[is_infeasible],
                 color="red",
                 marker="x",
                 linestyle="",
                 label="infeasible",
             )
 
-        plt.legend()
+        axes.legend()
 
         save_show_figure(fig, show, file_path)
 
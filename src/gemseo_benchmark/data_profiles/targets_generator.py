@@ -32,8 +32,10 @@ from typing import Final
 import matplotlib.pyplot as plt
 from gemseo.utils.matplotlib_figure import save_show_figure
 from matplotlib.ticker import MaxNLocator
+from numpy import array
 from numpy import linspace
 from numpy import ndarray
+from numpy import take
 
 from gemseo_benchmark.data_profiles.target_values import TargetValues
 from gemseo_benchmark.results.history_item import HistoryItem
@@ -146,10 +148,9 @@ class TargetsGenerator:
             median_history = median_history.remove_leading_infeasible()
 
         # Truncate the values that stagnate near the best target
-        for index, item in enumerate(median_history):
-            if item <= best_target:
-                median_history = median_history[: index + 1]
-                break
+        is_reached = median_history.is_lower_or_equal(best_target)
+        if is_reached.any():
+            median_history = median_history.shorten(is_reached.argmax() + 1)
 
         # Compute a budget scale
         budget_scale = self.__compute_budget_scale(
@@ -157,8 +158,14 @@ class TargetsGenerator:
         )
 
         # Compute the target values
-        target_values = TargetValues()
-        target_values.items = [median_history[item - 1] for item in budget_scale]
+        indices = budget_scale - 1
+        target_values = TargetValues(
+            take(median_history.objective_values, indices),
+            take(median_history.infeasibility_measures, indices),
+            n_unsatisfied_constraints=take(
+                array(median_history.n_unsatisfied_constraints, dtype=object), indices
+            ),
+        )
 
         # Plot the target values
         if show or file_path is not None:
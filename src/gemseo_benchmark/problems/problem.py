@@ -28,21 +28,30 @@ defining an instance of the problem) and its targets (refer to
 
 from __future__ import annotations
 
+import hashlib
 from collections.abc import Iterable
 from collections.abc import Mapping
+from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import Callable
+from typing import ClassVar
 from typing import Union
 
 from gemseo import compute_doe
 from gemseo import execute_algo
+from gemseo.algos.design_space import DesignSpace
 from gemseo.algos.opt.factory import OptimizationLibraryFactory
 from gemseo.algos.optimization_problem import OptimizationProblem
+from gemseo.core.parallel_execution.callable_parallel_execution import (
+    CallableParallelExecution,
+)
 from gemseo.utils.constants import READ_ONLY_EMPTY_DICT
 from gemseo.utils.matplotlib_figure import save_show_figure
 from matplotlib import pyplot as plt
 from matplotlib.ticker import MaxNLocator
 from numpy import array
+from numpy import ascontiguousarray
 from numpy import atleast_2d
 from numpy import load
 from numpy import ndarray
@@ -51,6 +60,7 @@ from numpy import save
 from gemseo_benchmark import COLORS_CYCLE
 from gemseo_benchmark import MarkeveryType
 from gemseo_benchmark import get_markers_cycle
+from gemseo_benchmark import join_substrings
 from gemseo_benchmark.data_profiles.data_profile import DataProfile
 from gemseo_benchmark.data_profiles.target_values import TargetValues
 from gemseo_benchmark.data_profiles.targets_generator import TargetsGenerator
@@ -58,8 +68,6 @@ from gemseo_benchmark.results.performance_histories import PerformanceHistories
 from gemseo_benchmark.results.performance_history import PerformanceHistory
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from gemseo.algos.doe.base_doe_library import DriverLibraryOptionType
 
     from gemseo_benchmark import ConfigurationPlotOptions
@@ -89,6 +97,18 @@ class Problem:
             Set to None if unknown.
     """
 
+    __start_points_cache: ClassVar[dict[str, ndarray]] = {}
+    """The starting points generated by DOE, per DOE settings and ``DesignSpace``.
+
+    The design spaces of other types, e.g. ``ParameterSpace``, are not cached.
+    """
+
+    start_points_cache_size: ClassVar[int] = 128
+    """The maximum number of DOEs whose starting points are cached.
+
+    When the cache is full, the oldest DOE is removed from it.
+    """
+
     def __init__(
         self,
         name: str,
@@ -291,12 +311,47 @@ class Problem:
         if doe_options is None:
             doe_options = {}
 
-        return compute_doe(
-            self._problem.design_space,
-            algo_name=doe_algo_name,
-            n_samples=doe_size,
-            **doe_options,
+        design_space = self._problem.design_space
+        if type(design_space) is not DesignSpace:
+            # N.B. the DOE may depend on more than the bounds of the variables,
+            # e.g. on the probability distributions of a ParameterSpace.
+            return compute_doe(
+                design_space, algo_name=doe_algo_name, n_samples=doe_size, **doe_options
+            )
+
+        # Reuse the starting points of another problem with the same design space
+        hash_object = hashlib.sha256()
+        _update_hash(
+            hash_object,
+            (
+                doe_algo_name,
+                doe_size,
+                doe_options,
+                tuple(design_space.variable_sizes.values()),
+                tuple(design_space.variable_types.values()),
+                design_space.get_lower_bounds(),
+                design_space.get_upper_bounds(),
+            ),
         )
+        key = hash_object.hexdigest()
+        start_points = self.__start_points_cache.get(key)
+        if start_points is None:
+            start_points = compute_doe(
+                design_space, algo_name=doe_algo_name, n_samples=doe_size, **doe_options
+            )
+            cache = self.__start_points_cache
+            while cache and len(cache) >= self.start_points_cache_size:
+                del cache[next(iter(cache))]
+
+            if self.start_points_cache_size > 0:
+                cache[key] = start_points
+
+        return start_points.copy()
+
+    @classmethod
+    def clear_start_points_cache(cls) -> None:
+        """Clear the cache of the starting points generated by DOE."""
+        cls.__start_points_cache.clear()
 
     @property
     def targets_generator(self) -> TargetsGenerator:
@@ -329,10 +384,21 @@ class Problem:
 
     def __iter__(self) -> OptimizationProblem:
         """Iterate on the problem instances with respect to the starting points."""
-        for start_point in self.start_points:
-            problem = self.creator()
-            problem.design_space.set_current_value(start_point)
-            yield problem
+        for index in range(len(self.start_points)):
+            yield self.create_instance(index)
+
+    def create_instance(self, index: int) -> OptimizationProblem:
+        """Create an instance of the problem from one of its starting points.
+
+        Args:
+            index: The index of the starting point.
+
+        Returns:
+            The instance of the problem.
+        """
+        problem = self.creator()
+        problem.design_space.set_current_value(self.start_points[index])
+        return problem
 
     @property
     def description(self) -> str:
@@ -373,6 +439,10 @@ class Problem:
         file_path: str | None = None,
         best_target_tolerance: float = 0.0,
         disable_stopping: bool = True,
+        number_of_processes: int = 1,
+        use_threading: bool = False,
+        reference_histories_path: str | Path | None = None,
+        results: Results | None = None,
     ) -> TargetValues:
         """Generate targets based on reference algorithms.
 
@@ -387,14 +457,44 @@ class Problem:
             best_target_tolerance: The relative tolerance for comparisons with the
                 best target value.
             disable_stopping: Whether to disable the stopping criteria.
+            number_of_processes: The maximum simultaneous number of threads or
+                processes used to parallelize the runs of the reference algorithms.
+            use_threading: Whether to use threads instead of processes
+                to parallelize the runs of the reference algorithms.
+            reference_histories_path: The path to the directory
+                where to cache the performance histories of the reference algorithms.
+                A reference algorithm is not run from a starting point
+                if its performance history is already cached.
+                If ``None``, the performance histories are not cached.
+            results: The paths to performance histories already generated
+                for this problem, e.g. by a benchmarking scenario.
+                A reference algorithm configuration is not run
+                if it has performance histories for this problem in ``results``;
+                these performance histories are used instead.
+                If ``None``, all the reference algorithm configurations are run.
 
         Returns:
             The generated targets.
         """
         self.__targets_generator = TargetsGenerator()
 
-        # Generate reference performance histories
+        # Gather the runs of the reference algorithms from every starting point
+        histories = []
+        paths = []
+        inputs = []
         for configuration in ref_algo_configurations:
+            # Reuse the performance histories already generated for the problem
+            if (
+                results is not None
+                and configuration.name in results.algorithms
+                and self.name in results.get_problems(configuration.name)
+            ):
+                for path in results.get_paths(configuration.name, self.name):
+                    histories.append(results.get_history(path))
+                    paths.append(None)
+
+                continue
+
             # Disable the stopping criteria
             options = dict(configuration.algorithm_options)
             if disable_stopping:
@@ -403,15 +503,57 @@ class Problem:
                 options["ftol_rel"] = 0.0
                 options["ftol_abs"] = 0.0
 
-            for instance in self:
-                execute_algo(
-                    instance,
-                    algo_type="opt",
-                    algo_name=configuration.algorithm_name,
-                    **options,
-                )
-                history = PerformanceHistory.from_problem(instance)
-                self.__targets_generator.add_history(history=history)
+            for index, start_point in enumerate(self.start_points):
+                if reference_histories_path is None:
+                    path = None
+                else:
+                    path = self.__get_reference_history_path(
+                        Path(reference_histories_path),
+                        configuration.algorithm_name,
+                        options,
+                        start_point,
+                    )
+
+                if path is not None and path.is_file():
+                    histories.append(PerformanceHistory.from_file(path))
+                else:
+                    histories.append(None)
+                    inputs.append((configuration.algorithm_name, options, index))
+
+                paths.append(path)
+
+        # Generate the missing reference performance histories
+        if number_of_processes == 1:
+            # N.B. the problem instances are created one at a time
+            # so that each one is released after its run.
+            new_histories = (
+                _compute_reference_history((
+                    algorithm_name,
+                    options,
+                    self.create_instance(index),
+                ))
+                for algorithm_name, options, index in inputs
+            )
+        else:
+            new_histories = CallableParallelExecution(
+                [_compute_reference_history],
+                number_of_processes,
+                use_threading,
+                exceptions_to_re_raise=(Exception,),
+            ).execute([
+                (algorithm_name, options, self.create_instance(index))
+                for algorithm_name, options, index in inputs
+            ])
+
+        new_histories = iter(new_histories)
+        for history, path in zip(histories, paths):
+            if history is None:
+                history = next(new_histories)
+                if path is not None:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    history.to_file(path)
+
+            self.__targets_generator.add_history(history=history)
 
         # Compute the target values
         target_values = self.__targets_generator.compute_target_values(
@@ -427,6 +569,35 @@ class Problem:
 
         return target_values
 
+    def __get_reference_history_path(
+        self,
+        root_path: Path,
+        algorithm_name: str,
+        algorithm_options: Mapping[str, Any],
+        start_point: ndarray,
+    ) -> Path:
+        """Return the path to the cached performance history of a reference algorithm.
+
+        The name of the file identifies the algorithm options and the starting point.
+
+        Args:
+            root_path: The path to the root directory of the cache.
+            algorithm_name: The name of the reference algorithm.
+            algorithm_options: The options of the reference algorithm.
+            start_point: The starting point of the reference algorithm.
+
+        Returns:
+            The path to the performance history file.
+        """
+        key = hashlib.sha256()
+        _update_hash(key, algorithm_options)
+        key.update(array(start_point, dtype=float).tobytes())
+        return (
+            root_path
+            / join_substrings(self.name)
+            / f"{join_substrings(algorithm_name)}.{key.hexdigest()}.json"
+        )
+
     @staticmethod
     def compute_performance(
         problem: OptimizationProblem,
@@ -560,7 +731,7 @@ class Problem:
         # Generate the performance histories
         for configuration_name in algos_configurations.names:
             for history_path in results.get_paths(configuration_name, self.name):
-                history = PerformanceHistory.from_file(history_path)
+                history = results.get_history(history_path)
                 if max_eval_number is not None:
                     history = history.shorten(max_eval_number)
 
@@ -710,7 +881,7 @@ class Problem:
             minima[configuration_name] = PerformanceHistories()
             for path in results.get_paths(configuration_name, self.name):
                 # Get the history of the cumulated minimum
-                history = PerformanceHistory.from_file(path)
+                history = results.get_history(path)
                 if max_eval_number is not None:
                     history = history.shorten(max_eval_number)
 
@@ -759,3 +930,52 @@ class Problem:
         return max_feasible_objective + y_relative_margin * (
             max_feasible_objective - self.optimum
         )
+
+
+def _compute_reference_history(
+    args: tuple[str, Mapping[str, Any], OptimizationProblem],
+) -> PerformanceHistory:
+    """Run a reference algorithm on a problem instance.
+
+    Args:
+        args: The name of the algorithm, the options of the algorithm
+            and the instance of the problem.
+
+    Returns:
+        The performance history of the algorithm run.
+    """
+    algorithm_name, algorithm_options, instance = args
+    execute_algo(
+        instance, algo_type="opt", algo_name=algorithm_name, **algorithm_options
+    )
+    return PerformanceHistory.from_problem(instance)
+
+
+def _update_hash(hash_object: Any, value: Any) -> None:
+    """Update a hash object with a value.
+
+    The arrays are hashed from their data rather than from their representations,
+    which NumPy abbreviates for large arrays.
+
+    Args:
+        hash_object: The hash object, e.g. ``hashlib.sha256()``.
+        value: The value,
+            possibly a mapping, a list or a tuple of values.
+    """
+    if isinstance(value, ndarray) and value.dtype != object:
+        hash_object.update(f"ndarray({value.dtype.str},{value.shape})".encode())
+        hash_object.update(ascontiguousarray(value).tobytes())
+    elif isinstance(value, ndarray):
+        _update_hash(hash_object, value.tolist())
+    elif isinstance(value, Mapping):
+        hash_object.update(f"{type(value).__name__}({len(value)})".encode())
+        for key in sorted(value, key=repr):
+            _update_hash(hash_object, key)
+            _update_hash(hash_object, value[key])
+    elif isinstance(value, (list, tuple)):
+        hash_object.update(f"{type(value).__name__}({len(value)})".encode())
+        for item in value:
+            _update_hash(hash_object, item)
+    else:
+        representation = repr(value)
+        hash_object.update(f"{len(representation)}:{representation}".encode())
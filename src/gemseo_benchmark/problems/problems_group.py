@@ -27,7 +27,6 @@ from typing import TYPE_CHECKING
 from gemseo.utils.constants import READ_ONLY_EMPTY_DICT
 
 from gemseo_benchmark.data_profiles.data_profile import DataProfile
-from gemseo_benchmark.results.performance_history import PerformanceHistory
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -90,6 +89,10 @@ class ProblemsGroup:
         targets_number: int,
         ref_algos_configurations: AlgorithmsConfigurations,
         only_feasible: bool = True,
+        number_of_processes: int = 1,
+        use_threading: bool = False,
+        reference_histories_path: str | Path | None = None,
+        results: Results | None = None,
     ) -> None:
         """Generate targets for all the problems based on given reference algorithms.
 
@@ -97,10 +100,32 @@ class ProblemsGroup:
             targets_number: The number of targets to generate.
             ref_algos_configurations: The configurations of the reference algorithms.
             only_feasible: Whether to generate only feasible targets.
+            number_of_processes: The maximum simultaneous number of threads or
+                processes used to parallelize the runs of the reference algorithms.
+            use_threading: Whether to use threads instead of processes
+                to parallelize the runs of the reference algorithms.
+            reference_histories_path: The path to the directory
+                where to cache the performance histories of the reference algorithms,
+                in a subdirectory per problem.
+                A reference algorithm is not run from a starting point of a problem
+                if its performance history is already cached.
+                If ``None``, the performance histories are not cached.
+            results: The paths to performance histories already generated
+                for the problems, e.g. by a benchmarking scenario.
+                A reference algorithm configuration is not run on a problem
+                if it has performance histories for this problem in ``results``;
+                these performance histories are used instead.
+                If ``None``, all the reference algorithm configurations are run.
         """
         for problem in self.__problems:
             problem.compute_targets(
-                targets_number, ref_algos_configurations, only_feasible
+                targets_number,
+                ref_algos_configurations,
+                only_feasible,
+                number_of_processes=number_of_processes,
+                use_threading=use_threading,
+                reference_histories_path=reference_histories_path,
+                results=results,
             )
 
     def compute_data_profile(
@@ -141,7 +166,7 @@ class ProblemsGroup:
                 for history_path in histories_paths.get_paths(
                     configuration_name, problem.name
                 ):
-                    history = PerformanceHistory.from_file(history_path)
+                    history = histories_paths.get_history(history_path)
                     if max_eval_number:
                         history = history.shorten(max_eval_number)
                     history.apply_infeasibility_tolerance(infeasibility_tolerance)
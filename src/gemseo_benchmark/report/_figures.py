@@ -31,7 +31,6 @@ from gemseo_benchmark import MarkeveryType
 from gemseo_benchmark import _get_configuration_plot_options
 from gemseo_benchmark import join_substrings
 from gemseo_benchmark.results.performance_histories import PerformanceHistories
-from gemseo_benchmark.results.performance_history import PerformanceHistory
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -46,6 +45,7 @@ if TYPE_CHECKING:
     )
     from gemseo_benchmark.problems.problem import Problem
     from gemseo_benchmark.problems.problems_group import ProblemsGroup
+    from gemseo_benchmark.results.performance_history import PerformanceHistory
     from gemseo_benchmark.results.results import Results
 
 
@@ -184,7 +184,7 @@ class Figures:
             # Gather the performance histories
             performance_histories = {
                 algorithm_configuration: PerformanceHistories(*[
-                    PerformanceHistory.from_file(path)
+                    self.__results.get_history(path)
                     for path in self.__results.get_paths(
                         algorithm_configuration.name, problem.name
                     )
@@ -25,6 +25,8 @@ from __future__ import annotations
 class HistoryItem:
     """A performance history item."""
 
+    __slots__ = ("__infeas_measure", "__n_unsatisfied_constraints", "__objective_value")
+
     def __init__(
         self,
         objective_value: float,
@@ -154,7 +156,10 @@ class HistoryItem:
         Returns:
             Whether the history item is lower than or equal to the other one.
         """
-        return self < other or self == other
+        return self.__infeas_measure < other.__infeas_measure or (
+            self.__infeas_measure == other.__infeas_measure
+            and self.__objective_value <= other.__objective_value
+        )
 
     @property
     def is_feasible(self) -> bool:
@@ -17,9 +17,7 @@
 from __future__ import annotations
 
 import collections.abc
-import statistics
 from typing import TYPE_CHECKING
-from typing import Callable
 
 import numpy
 from matplotlib.ticker import MaxNLocator
@@ -73,9 +71,8 @@ class PerformanceHistories(collections.abc.MutableSequence):
 
     def get_equal_size_histories(self) -> PerformanceHistories:
         """Return the histories extended to the maximum size."""
-        return PerformanceHistories(*[
-            history.extend(self.__maximum_size) for history in self
-        ])
+        maximum_size = self.__maximum_size
+        return PerformanceHistories(*[history.extend(maximum_size) for history in self])
 
     @property
     def __maximum_size(self) -> int:
@@ -88,7 +85,7 @@ class PerformanceHistories(collections.abc.MutableSequence):
         Returns:
             The itemwise minimum history of the collection.
         """
-        return self.__compute_itemwise_statistic(min)
+        return self.__compute_itemwise_statistic(0)
 
     def compute_maximum(self) -> PerformanceHistory:
         """Return the itemwise maximum history of the collection.
@@ -96,7 +93,10 @@ class PerformanceHistories(collections.abc.MutableSequence):
         Returns:
             The itemwise maximum history of the collection.
         """
-        return self.__compute_itemwise_statistic(max)
+        # N.B. the histories are reversed
+        # so that the last of equal items is the one of the first history,
+        # as with the builtin max.
+        return self.__compute_itemwise_statistic(-1, reverse=True)
 
     def compute_median(self, compute_low_median: bool = True) -> PerformanceHistory:
         """Return the itemwise median history of the collection.
@@ -109,32 +109,52 @@ class PerformanceHistories(collections.abc.MutableSequence):
             The itemwise median history of the collection.
         """
         if compute_low_median:
-            return self.__compute_itemwise_statistic(statistics.median_low)
+            return self.__compute_itemwise_statistic((len(self) - 1) // 2)
 
-        return self.__compute_itemwise_statistic(statistics.median_high)
+        return self.__compute_itemwise_statistic(len(self) // 2)
 
     def __compute_itemwise_statistic(
-        self,
-        statistic_computer: Callable[[tuple[HistoryItem]], HistoryItem],
+        self, position: int, reverse: bool = False
     ) -> PerformanceHistory:
         """Return the history of an itemwise statistic of the collection.
 
         The histories are extended to the same length before being split.
+        At each iteration,
+        the items of the histories are sorted in the order of :class:`.HistoryItem`
+        and the statistic is the item at a given position.
 
         Args:
-            statistic_computer: The computer of the statistic.
+            position: The position of the statistic among the sorted items.
+            reverse: Whether to sort the items of the histories in reverse order
+                when they are equal.
 
         Returns:
             The history of the itemwise statistic.
         """
-        history = PerformanceHistory()
-        history.items = [
-            statistic_computer(items)
-            for items in zip(*[
-                history.items for history in self.get_equal_size_histories()
-            ])
+        histories = list(self.get_equal_size_histories())
+        if reverse:
+            histories.reverse()
+
+        objective_values = numpy.array([
+            history.objective_values for history in histories
+        ])
+        infeasibility_measures = numpy.array([
+            history.infeasibility_measures for history in histories
+        ])
+        n_unsatisfied_constraints = numpy.array(
+            [history.n_unsatisfied_constraints for history in histories], dtype=object
+        )
+        # N.B. numpy.lexsort is stable, as the builtin sorted,
+        # so the equal items remain in the order of the histories.
+        rows = numpy.lexsort((objective_values, infeasibility_measures), axis=0)[
+            position
         ]
-        return history
+        columns = numpy.arange(objective_values.shape[1])
+        return PerformanceHistory(
+            objective_values[rows, columns],
+            infeasibility_measures[rows, columns],
+            n_unsatisfied_constraints=n_unsatisfied_constraints[rows, columns],
+        )
 
     def cumulate_minimum(self) -> PerformanceHistories:
         """Return the histories of the minimum."""
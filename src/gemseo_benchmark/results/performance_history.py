@@ -37,22 +37,33 @@ from __future__ import annotations
 import collections.abc
 import json
 from copy import copy
-from functools import reduce
-from itertools import chain
-from itertools import repeat
 from itertools import starmap
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import Final
+from typing import NoReturn
 
+from numpy import arange
+from numpy import array
 from numpy import atleast_1d
+from numpy import concatenate
+from numpy import empty_like
+from numpy import full
 from numpy import inf
+from numpy import lexsort
+from numpy import minimum
+from numpy import ndarray
+from numpy import newaxis
+from numpy import where
+from numpy import zeros
 
 from gemseo_benchmark.algorithms.algorithm_configuration import AlgorithmConfiguration
 from gemseo_benchmark.results.history_item import HistoryItem
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Iterator
     from collections.abc import Sequence
 
     from gemseo.algos.optimization_problem import OptimizationProblem
@@ -63,6 +74,8 @@ class PerformanceHistory(collections.abc.Sequence):
     r"""A history of performance measures generated by an algorithm.
 
     A :class:`.PerformanceHistory` is a sequence of :class:`.HistoryItem`\ s.
+    The values of the items are stored in arrays,
+    and the items are created only when they are accessed.
 
     Attributes:
         problem_name (str): The name of the problem.
@@ -80,6 +93,17 @@ class PerformanceHistory(collections.abc.Sequence):
     __OBJECTIVE_NAME: Final[str] = "objective_name"
     __PERFORMANCE: Final[str] = "performance"
     __PROBLEM: Final[str] = "problem"
+    __UNKNOWN_N_UNSATISFIED_CONSTRAINTS: Final[int] = -1
+    """The value standing for an unknown number of unsatisfied constraints."""
+
+    __infeasibility_measures: ndarray
+    """The infeasibility measures."""
+
+    __n_unsatisfied_constraints: ndarray
+    """The numbers of unsatisfied constraints, -1 standing for an unknown number."""
+
+    __objective_values: ndarray
+    """The objective values."""
 
     def __init__(
         self,
@@ -145,11 +169,13 @@ class PerformanceHistory(collections.abc.Sequence):
         self._objective_name = objective_name
         self.algorithm_configuration = algorithm_configuration
         self.doe_size = doe_size
-        self.items = self.__get_history_items(
-            objective_values,
-            infeasibility_measures,
-            feasibility_statuses,
-            n_unsatisfied_constraints,
+        self.__set_values(
+            *self.__get_values(
+                objective_values,
+                infeasibility_measures,
+                feasibility_statuses,
+                n_unsatisfied_constraints,
+            )
         )
         self.problem_name = problem_name
         self._number_of_variables = number_of_variables
@@ -158,32 +184,48 @@ class PerformanceHistory(collections.abc.Sequence):
     @property
     def objective_values(self) -> list[float]:
         """The objective values."""
-        return [item.objective_value for item in self.items]
+        return self.__objective_values.tolist()
 
     @property
     def infeasibility_measures(self) -> list[float]:
         """The infeasibility measures."""
-        return [item.infeasibility_measure for item in self.items]
+        return self.__infeasibility_measures.tolist()
 
     @property
     def n_unsatisfied_constraints(self) -> list[int]:
         """The numbers of unsatisfied constraints."""
-        return [item.n_unsatisfied_constraints for item in self.items]
+        return [
+            None if number == self.__UNKNOWN_N_UNSATISFIED_CONSTRAINTS else number
+            for number in self.__n_unsatisfied_constraints.tolist()
+        ]
 
     @property
-    def items(self) -> list[HistoryItem]:
+    def items(self) -> Sequence[HistoryItem]:
         """The history items.
 
+        The returned list cannot be modified in place;
+        the history items must be set instead, e.g. ``history.items = items``.
+
         Raises:
             TypeError: If an item is set with a type different from HistoryItem.
         """
-        return self.__items
+        return _ReadOnlyList(
+            starmap(
+                HistoryItem,
+                zip(
+                    self.objective_values,
+                    self.infeasibility_measures,
+                    self.n_unsatisfied_constraints,
+                ),
+            )
+        )
 
     @items.setter
     def items(
         self,
         history_items: Iterable[HistoryItem],
     ) -> None:
+        history_items = list(history_items)
         for item in history_items:
             if not isinstance(item, HistoryItem):
                 msg = (
@@ -192,16 +234,49 @@ class PerformanceHistory(collections.abc.Sequence):
                 )
                 raise TypeError(msg)
 
-        self.__items = list(history_items)
+        self.__set_values(
+            array([item.objective_value for item in history_items], dtype=float),
+            array([item.infeasibility_measure for item in history_items], dtype=float),
+            array(
+                [
+                    self.__UNKNOWN_N_UNSATISFIED_CONSTRAINTS
+                    if item.n_unsatisfied_constraints is None
+                    else item.n_unsatisfied_constraints
+                    for item in history_items
+                ],
+                dtype=int,
+            ),
+        )
+
+    def __set_values(
+        self,
+        objective_values: ndarray,
+        infeasibility_measures: ndarray,
+        n_unsatisfied_constraints: ndarray,
+    ) -> None:
+        """Set the values of the history items.
+
+        The arrays are never modified in place afterwards,
+        so that they can be shared by the copies of the performance history.
+
+        Args:
+            objective_values: The objective values.
+            infeasibility_measures: The infeasibility measures.
+            n_unsatisfied_constraints: The numbers of unsatisfied constraints,
+                -1 standing for an unknown number.
+        """
+        self.__objective_values = objective_values
+        self.__infeasibility_measures = infeasibility_measures
+        self.__n_unsatisfied_constraints = n_unsatisfied_constraints
 
     @staticmethod
-    def __get_history_items(
+    def __get_values(
         objective_values: Sequence[float] | None = None,
         infeasibility_measures: Sequence[float] | None = None,
         feasibility_statuses: Sequence[bool] | None = None,
         n_unsatisfied_constraints: Sequence[int] | None = None,
-    ) -> list[HistoryItem]:
-        """Return history items based on values histories.
+    ) -> tuple[ndarray, ndarray, ndarray]:
+        """Return the values of the history items based on values histories.
 
         Args:
             objective_values: The history of the quantity to be minimized.
@@ -226,7 +301,17 @@ class PerformanceHistory(collections.abc.Sequence):
                 and None for infeasible entries.
 
         Returns:
-            The history items.
+            The objective values,
+            the infeasibility measures
+            and the numbers of unsatisfied constraints,
+            -1 standing for an unknown number.
+
+        Raises:
+            ValueError: If the lengths of the histories do not match,
+                if an infeasibility measure is negative,
+                if a number of unsatisfied constraints is negative,
+                or if an infeasibility measure and a number of unsatisfied
+                constraints are inconsistent.
         """
         if objective_values is None:
             objective_values = []
@@ -245,40 +330,96 @@ class PerformanceHistory(collections.abc.Sequence):
                     "must have same length."
                 )
                 raise ValueError(msg)
-            infeasibility_measures = [
-                0.0 if is_feas else inf for is_feas in feasibility_statuses
-            ]
+            infeasibility_measures = where(
+                array(feasibility_statuses, dtype=bool), 0.0, inf
+            )
         else:
-            infeasibility_measures = [0.0] * len(objective_values)
+            infeasibility_measures = zeros(len(objective_values))
+
+        objective_values = array(objective_values, dtype=float)
+        infeasibility_measures = array(infeasibility_measures, dtype=float)
+        is_negative = infeasibility_measures < 0.0
+        if is_negative.any():
+            msg = (
+                "The infeasibility measure is negative: "
+                f"{infeasibility_measures[is_negative][0]}."
+            )
+            raise ValueError(msg)
 
+        unknown_number = PerformanceHistory.__UNKNOWN_N_UNSATISFIED_CONSTRAINTS
+        is_feasible = infeasibility_measures == 0.0
         if n_unsatisfied_constraints is None:
-            n_unsatisfied_constraints = [
-                0 if entry == 0.0 else None for entry in infeasibility_measures
-            ]
-        elif len(n_unsatisfied_constraints) != len(infeasibility_measures):
+            return (
+                objective_values,
+                infeasibility_measures,
+                where(is_feasible, 0, unknown_number),
+            )
+
+        if len(n_unsatisfied_constraints) != len(infeasibility_measures):
             msg = (
                 "The unsatisfied constraints history and the feasibility history"
                 " must have same length."
             )
             raise ValueError(msg)
 
-        return list(
-            starmap(
-                HistoryItem,
-                zip(
-                    objective_values, infeasibility_measures, n_unsatisfied_constraints
-                ),
+        # N.B. the unknown numbers are replaced with the sentinel value
+        # only after validation, so that a negative input number is not taken for one.
+        is_unknown = array(
+            [number is None for number in n_unsatisfied_constraints], dtype=bool
+        )
+        numbers = array(
+            [0 if number is None else number for number in n_unsatisfied_constraints],
+            dtype=int,
+        )
+        is_negative = numbers < 0
+        if is_negative.any():
+            msg = (
+                "The number of unsatisfied constraints is negative: "
+                f"{numbers[is_negative][0]}."
             )
+            raise ValueError(msg)
+
+        is_inconsistent = ~is_unknown & (
+            (is_feasible & (numbers != 0))
+            | ((infeasibility_measures > 0.0) & (numbers == 0))
+        )
+        if is_inconsistent.any():
+            index = is_inconsistent.argmax()
+            msg = (
+                f"The infeasibility measure ({infeasibility_measures[index]}) "
+                "and the number "
+                f"of unsatisfied constraints ({numbers[index]}) are not "
+                f"consistent."
+            )
+            raise ValueError(msg)
+
+        return (
+            objective_values,
+            infeasibility_measures,
+            where(is_unknown, where(is_feasible, 0, unknown_number), numbers),
         )
 
     def __len__(self) -> int:
-        return len(self.__items)
+        return len(self.__objective_values)
 
     def __getitem__(
         self,
-        i: int,
-    ) -> HistoryItem:
-        return self.__items[i]
+        i: int | slice,
+    ) -> HistoryItem | list[HistoryItem]:
+        if isinstance(i, slice):
+            return list(self.items[i])
+
+        n_unsatisfied_constraints = int(self.__n_unsatisfied_constraints[i])
+        return HistoryItem(
+            float(self.__objective_values[i]),
+            float(self.__infeasibility_measures[i]),
+            None
+            if n_unsatisfied_constraints == self.__UNKNOWN_N_UNSATISFIED_CONSTRAINTS
+            else n_unsatisfied_constraints,
+        )
+
+    def __iter__(self) -> Iterator[HistoryItem]:
+        return iter(self.items)
 
     def __repr__(self) -> str:
         return str(list(self))
@@ -289,12 +430,50 @@ class PerformanceHistory(collections.abc.Sequence):
         Returns:
             The history of the cumulated minimum.
         """
+        # Rank the items in the lexicographic order of HistoryItem,
+        # the first of equal items being ranked first as with the builtin min,
+        # so that the cumulated minimum of the ranks indicates the minimum items.
+        order = lexsort((self.__objective_values, self.__infeasibility_measures))
+        ranks = empty_like(order)
+        ranks[order] = arange(len(order))
+        indices = order[minimum.accumulate(ranks)]
         minimum_history = copy(self)
-        minimum_history.items = [
-            reduce(min, self.__items[: i + 1]) for i in range(len(self))
-        ]
+        minimum_history.__set_values(
+            self.__objective_values[indices],
+            self.__infeasibility_measures[indices],
+            self.__n_unsatisfied_constraints[indices],
+        )
         return minimum_history
 
+    def is_lower_or_equal(self, other: HistoryItem | PerformanceHistory) -> ndarray:
+        """Compare the history items with a history item or another history.
+
+        The items are compared as with ``HistoryItem.__le__``,
+        i.e. lexicographically on the infeasibility measure and the objective value.
+
+        Args:
+            other: The history item or the other performance history.
+
+        Returns:
+            Whether the *i*-th history item is lower than or equal to
+            the history item, for each index *i*,
+            or to the *j*-th history item of the other performance history,
+            for each row *i* and column *j*.
+        """
+        if isinstance(other, HistoryItem):
+            measures = self.__infeasibility_measures
+            return (measures < other.infeasibility_measure) | (
+                (measures == other.infeasibility_measure)
+                & (self.__objective_values <= other.objective_value)
+            )
+
+        measures = self.__infeasibility_measures[:, newaxis]
+        other_measures = other.__infeasibility_measures
+        return (measures < other_measures) | (
+            (measures == other_measures)
+            & (self.__objective_values[:, newaxis] <= other.__objective_values)
+        )
+
     # TODO: deprecate this method in favor of PerformanceHistories.compute_minimum
     @staticmethod
     def compute_minimum_history(
@@ -352,15 +531,10 @@ class PerformanceHistory(collections.abc.Sequence):
         Returns:
             The truncated performance history.
         """
-        first_feasible = None
-        for index, item in enumerate(self):
-            if item.is_feasible:
-                first_feasible = index
-                break
-
+        is_feasible = self.__infeasibility_measures == 0.0
         truncated_history = copy(self)
-        if first_feasible is not None:
-            truncated_history.items = self.items[first_feasible:]
+        if is_feasible.any():
+            truncated_history.__slice(slice(is_feasible.argmax(), None))
 
         return truncated_history
 
@@ -375,15 +549,18 @@ class PerformanceHistory(collections.abc.Sequence):
         """
         items_data = []
         # Add each history item in dictionary format
-        for item in self.items:
+        for objective_value, infeasibility_measure, n_unsatisfied_constraints in zip(
+            self.objective_values,
+            self.infeasibility_measures,
+            self.n_unsatisfied_constraints,
+        ):
             data_item = {
-                PerformanceHistory.__PERFORMANCE: item.objective_value,
-                PerformanceHistory.__INFEASIBILITY: item.infeasibility_measure,
+                PerformanceHistory.__PERFORMANCE: objective_value,
+                PerformanceHistory.__INFEASIBILITY: infeasibility_measure,
             }
-            if item.n_unsatisfied_constraints is not None:
-                # N.B. type int64 is not JSON serializable
-                data_item[PerformanceHistory.__N_UNSATISFIED_CONSTRAINTS] = int(
-                    item.n_unsatisfied_constraints
+            if n_unsatisfied_constraints is not None:
+                data_item[PerformanceHistory.__N_UNSATISFIED_CONSTRAINTS] = (
+                    n_unsatisfied_constraints
                 )
 
             items_data.append(data_item)
@@ -411,8 +588,9 @@ class PerformanceHistory(collections.abc.Sequence):
             data[self.__EXECUTION_TIME] = self.total_time
 
         data[self.__HISTORY_ITEMS] = items_data
-        with Path(path).open("w") as file:
-            json.dump(data, file, indent=2, separators=(",", ": "))
+        # N.B. json.dump writes the file chunk by chunk while json.dumps encodes
+        # the whole document at once, which is faster for long histories.
+        Path(path).write_text(json.dumps(data, indent=2, separators=(",", ": ")))
 
     @classmethod
     def from_file(cls, path: str | Path) -> PerformanceHistory:
@@ -424,23 +602,21 @@ class PerformanceHistory(collections.abc.Sequence):
         Returns:
             The performance history.
         """
-        with Path(path).open("r") as file:
-            data = json.load(file)
-
+        data = json.loads(Path(path).read_text())
         # Cover deprecated performance history files
-        if isinstance(data, list):
-            history = cls()
-            history.items = [
-                HistoryItem(
-                    item_data[PerformanceHistory.__PERFORMANCE],
-                    item_data[PerformanceHistory.__INFEASIBILITY],
-                    item_data.get(PerformanceHistory.__N_UNSATISFIED_CONSTRAINTS),
-                )
-                for item_data in data
-            ]
+        is_deprecated = isinstance(data, list)
+        items_data = data if is_deprecated else data[cls.__HISTORY_ITEMS]
+        history = cls(
+            [item_data[cls.__PERFORMANCE] for item_data in items_data],
+            [item_data[cls.__INFEASIBILITY] for item_data in items_data],
+            n_unsatisfied_constraints=[
+                item_data.get(cls.__N_UNSATISFIED_CONSTRAINTS)
+                for item_data in items_data
+            ],
+        )
+        if is_deprecated:
             return history
 
-        history = cls()
         history.problem_name = data.get(cls.__PROBLEM)
         history._number_of_variables = data.get(cls.__NUMBER_OF_VARIABLES)
         history._objective_name = data[cls.__OBJECTIVE_NAME]
@@ -452,14 +628,6 @@ class PerformanceHistory(collections.abc.Sequence):
 
         history.doe_size = data.get(cls.__DOE_SIZE)
         history.total_time = data.get(cls.__EXECUTION_TIME)
-        history.items = [
-            HistoryItem(
-                item_data[PerformanceHistory.__PERFORMANCE],
-                item_data[PerformanceHistory.__INFEASIBILITY],
-                item_data.get(PerformanceHistory.__N_UNSATISFIED_CONSTRAINTS),
-            )
-            for item_data in data[cls.__HISTORY_ITEMS]
-        ]
         return history
 
     @classmethod
@@ -479,32 +647,30 @@ class PerformanceHistory(collections.abc.Sequence):
             The performance history.
         """
         obj_name = problem.objective.name
-        obj_values = []
-        infeas_measures = []
-        feas_statuses = []
-        n_unsatisfied_constraints = []
         functions_names = {obj_name, *problem.constraints.get_names()}
-        for design_values, output_values in problem.database.items():
-            # Only consider points with all functions values
-            if not functions_names <= set(output_values.keys()):
-                continue
-
-            x_vect = design_values.unwrap()
-            obj_values.append(atleast_1d(output_values[obj_name]).real[0])
-            feasibility, measure = problem.history.check_design_point_is_feasible(
-                x_vect
-            )
-            number_of_unsatisfied_constraints = (
-                problem.constraints.get_number_of_unsatisfied_constraints(output_values)
-            )
-            infeas_measures.append(measure)
-            feas_statuses.append(feasibility)
-            n_unsatisfied_constraints.append(number_of_unsatisfied_constraints)
-
+        # Only consider points with all functions values
+        entries = [
+            (design_values, output_values)
+            for design_values, output_values in problem.database.items()
+            if functions_names <= output_values.keys()
+        ]
+        obj_values = [
+            atleast_1d(output_values[obj_name]).real[0] for _, output_values in entries
+        ]
+        # N.B. the feasibility statuses are not stored
+        # since they are disregarded when the infeasibility measures are passed.
+        infeas_measures = [
+            problem.history.check_design_point_is_feasible(design_values.unwrap())[1]
+            for design_values, _ in entries
+        ]
+        n_unsatisfied_constraints = [
+            problem.constraints.get_number_of_unsatisfied_constraints(output_values)
+            for _, output_values in entries
+        ]
         return cls(
             obj_values,
             infeas_measures,
-            feas_statuses,
+            None,
             n_unsatisfied_constraints,
             problem_name,
             problem.objective.name,
@@ -564,7 +730,17 @@ class PerformanceHistory(collections.abc.Sequence):
             raise ValueError(msg)
 
         history = copy(self)
-        history.items = list(chain(self, repeat(self[-1], (size - len(self)))))
+        extension_size = size - len(self)
+        history.__set_values(
+            *(
+                concatenate((values, full(extension_size, values[-1])))
+                for values in (
+                    self.__objective_values,
+                    self.__infeasibility_measures,
+                    self.__n_unsatisfied_constraints,
+                )
+            )
+        )
         return history
 
     def shorten(self, size: int) -> PerformanceHistory:
@@ -579,9 +755,21 @@ class PerformanceHistory(collections.abc.Sequence):
             The shortened performance history.
         """
         history = copy(self)
-        history.items = self.items[:size]
+        history.__slice(slice(size))
         return history
 
+    def __slice(self, items_slice: slice) -> None:
+        """Keep only a slice of the history items.
+
+        Args:
+            items_slice: The slice of the history items.
+        """
+        self.__set_values(
+            self.__objective_values[items_slice],
+            self.__infeasibility_measures[items_slice],
+            self.__n_unsatisfied_constraints[items_slice],
+        )
+
     def plot(self, axes: Axes, only_feasible: bool, **kwargs: str | float) -> None:
         """Plot the performance history.
 
@@ -603,5 +791,32 @@ class PerformanceHistory(collections.abc.Sequence):
         Args:
             infeasibility_tolerance: the tolerance on the infeasibility measure.
         """
-        for item in self.items:
-            item.apply_infeasibility_tolerance(infeasibility_tolerance)
+        is_feasible = self.__infeasibility_measures <= infeasibility_tolerance
+        self.__set_values(
+            self.__objective_values,
+            where(is_feasible, 0.0, self.__infeasibility_measures),
+            where(is_feasible, 0, self.__n_unsatisfied_constraints),
+        )
+
+
+class _ReadOnlyList(collections.UserList):
+    """A list that cannot be modified in place."""
+
+    def __raise_error(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Raise an error when the list is modified in place.
+
+        Args:
+            *args: The positional arguments of the modifying method.
+            **kwargs: The keyword arguments of the modifying method.
+
+        Raises:
+            TypeError: Whenever called.
+        """
+        msg = (
+            "The history items cannot be modified in place; "
+            "set PerformanceHistory.items instead."
+        )
+        raise TypeError(msg)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = __raise_error
+    append = extend = insert = pop = remove = clear = sort = reverse = __raise_error
@@ -22,19 +22,30 @@
 from __future__ import annotations
 
 import json
+from copy import copy
 from pathlib import Path
 
+from gemseo_benchmark.results.performance_history import PerformanceHistory
+
 
 class Results:
     """A collection of paths to performance histories."""
 
-    def __init__(self, path: str | Path | None = None) -> None:
+    def __init__(
+        self, path: str | Path | None = None, histories_cache_size: int = 128
+    ) -> None:
         """
         Args:
             path: The path to the JSON file from which to load the paths.
                 If ``None``, the collection is initially empty.
+            histories_cache_size: The maximum number of performance histories
+                kept in memory by ``get_history``.
+                When this number is reached,
+                the least recently used performance history is removed from memory.
         """  # noqa: D205, D212, D415
         self.__dict = {}
+        self.__histories = {}
+        self.__histories_cache_size = histories_cache_size
         if path is not None:
             self.from_file(path)
 
@@ -165,3 +176,40 @@ class Results:
             and problem_name in self.__dict[algo_name]
             and path in self.__dict[algo_name][problem_name]
         )
+
+    def get_history(self, path: str | Path) -> PerformanceHistory:
+        """Return a performance history.
+
+        The performance history file is read only once,
+        unless its modification time or its size has changed since it was last read
+        or the performance history has been removed from memory
+        (see the argument ``histories_cache_size``).
+
+        Args:
+            path: The path to the performance history file.
+
+        Returns:
+            A copy of the performance history,
+            which can be modified without altering the cached one.
+        """
+        path = Path(path)
+        stat = path.stat()
+        # N.B. the size is checked as well
+        # since the modification time may not change when the file is rewritten quickly.
+        file_state = (stat.st_mtime_ns, stat.st_size)
+        # N.B. the entry is removed and inserted again
+        # so that the histories are ordered from the least recently used one.
+        cached_state, history = self.__histories.pop(path, (None, None))
+        if cached_state != file_state:
+            history = PerformanceHistory.from_file(path)
+            while self.__histories and (
+                len(self.__histories) >= self.__histories_cache_size
+            ):
+                del self.__histories[next(iter(self.__histories))]
+
+        if self.__histories_cache_size > 0:
+            self.__histories[path] = (file_state, history)
+
+        # N.B. a shallow copy suffices
+        # since the values of a performance history are never modified in place.
+        return copy(history)
@@ -34,6 +34,7 @@ from numpy import ndarray
 
 from gemseo_benchmark.data_profiles.target_values import TargetValues
 from gemseo_benchmark.problems.problem import Problem
+from gemseo_benchmark.results.performance_history import PerformanceHistory
 
 design_variables = array([0.0, 1.0])
 
@@ -266,12 +267,24 @@ def unknown_algorithms_configurations(
 ALGO_NAME = "SLSQP"
 
 
+@pytest.fixture
+def results_mock() -> mock.Mock:
+    """A mock of results reading the performance histories from their files."""
+    results = mock.Mock()
+    results.get_history = mock.Mock(side_effect=PerformanceHistory.from_file)
+    return results
+
+
 @pytest.fixture
 def results(
-    algorithm_configuration, unknown_algorithm_configuration, problem_a, problem_b
+    algorithm_configuration,
+    unknown_algorithm_configuration,
+    problem_a,
+    problem_b,
+    results_mock,
 ) -> mock.Mock:
     """The results of the benchmarking."""
-    results = mock.Mock()
+    results = results_mock
     results.algorithms = [
         algorithm_configuration.name,
         unknown_algorithm_configuration.name,
@@ -139,3 +139,15 @@ def test_different_sizes_data_profiles():
     profiles = data_profile.compute_data_profiles()
     pyplot.close("all")
     data_profile._plot_data_profiles(profiles)
+
+
+def test_compute_data_profiles_after_adding_history():
+    """Check that a data profile is computed again after the addition of a history."""
+    data_profile = DataProfile({"problem": TargetValues([1.0, 0.0])})
+    data_profile.add_history("problem", "algo", [2.0, 1.0, 0.0])
+    data_profile.add_history("problem", "other_algo", [0.0])
+    assert data_profile.compute_data_profiles()["algo"] == [0.0, 0.5, 1.0]
+    data_profile.add_history("problem", "algo", [2.0, 2.0])
+    profiles = data_profile.compute_data_profiles()
+    assert profiles["algo"] == [0.0, 0.25, 0.5]
+    assert profiles["other_algo"] == [1.0]
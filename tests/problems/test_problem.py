@@ -27,6 +27,10 @@ from unittest import mock
 
 import numpy
 import pytest
+from gemseo import execute_algo
+from gemseo.algos.optimization_problem import OptimizationProblem
+from gemseo.algos.parameter_space import ParameterSpace
+from gemseo.core.mdo_functions.mdo_function import MDOFunction
 from gemseo.problems.optimization.rosenbrock import Rosenbrock
 from matplotlib import pyplot
 from matplotlib.testing.decorators import image_comparison
@@ -38,6 +42,15 @@ from numpy.testing import assert_equal
 from gemseo_benchmark.data_profiles.target_values import TargetValues
 from gemseo_benchmark.problems.problem import Problem
 from gemseo_benchmark.results.performance_history import PerformanceHistory
+from gemseo_benchmark.results.results import Results
+
+
+@pytest.fixture(autouse=True)
+def clear_start_points_cache():
+    """Clear the cache of the starting points generated by DOE."""
+    Problem.clear_start_points_cache()
+    yield
+    Problem.clear_start_points_cache()
 
 
 def test_invalid_creator():
@@ -102,6 +115,14 @@ def test_start_points_iteration(creator):
     )
 
 
+def test_create_instance():
+    """Check the creation of a problem instance from a starting point."""
+    problem = Problem("Rosenbrock", Rosenbrock, [zeros(2), ones(2)])
+    instance = problem.create_instance(1)
+    assert_equal(instance.design_space.get_current_value(), ones(2))
+    assert len(instance.database) == 0
+
+
 def test_undefined_targets(creator):
     """Check the access to undefined targets."""
     problem = Problem("problem", creator, [zeros(2)])
@@ -117,6 +138,67 @@ def test_generate_start_points(creator):
     assert len(problem.start_points) == 5
 
 
+def test_generate_start_points_once():
+    """Check that problems with the same design space share their starting points."""
+    with mock.patch(
+        "gemseo_benchmark.problems.problem.compute_doe",
+        side_effect=lambda *args, **kwargs: ones((3, 2)),
+    ) as compute_doe:
+        first = Problem("first", Rosenbrock, doe_algo_name="mocked_doe", doe_size=3)
+        second = Problem("second", Rosenbrock, doe_algo_name="mocked_doe", doe_size=3)
+        Problem("third", Rosenbrock, doe_algo_name="mocked_doe", doe_size=4)
+
+    assert compute_doe.call_count == 2
+    assert_equal(first.start_points, second.start_points)
+
+
+def test_start_points_cache_size():
+    """Check the bound on the number of DOEs whose starting points are cached."""
+    with (
+        mock.patch(
+            "gemseo_benchmark.problems.problem.compute_doe",
+            side_effect=lambda *args, **kwargs: ones((3, 2)),
+        ) as compute_doe,
+        mock.patch.object(Problem, "start_points_cache_size", 1),
+    ):
+        Problem("first", Rosenbrock, doe_algo_name="mocked_doe", doe_size=3)
+        Problem("second", Rosenbrock, doe_algo_name="mocked_doe", doe_size=4)
+        Problem("third", Rosenbrock, doe_algo_name="mocked_doe", doe_size=4)
+        Problem("fourth", Rosenbrock, doe_algo_name="mocked_doe", doe_size=3)
+        assert compute_doe.call_count == 3
+        Problem.clear_start_points_cache()
+        Problem("fifth", Rosenbrock, doe_algo_name="mocked_doe", doe_size=3)
+        assert compute_doe.call_count == 4
+
+
+def test_start_points_parameter_space():
+    """Check that parameter spaces with different distributions do not share DOEs."""
+
+    def create_creator(distribution_name, **parameters):
+        def create_problem():
+            parameter_space = ParameterSpace()
+            parameter_space.add_random_variable("x", distribution_name, **parameters)
+            problem = OptimizationProblem(parameter_space)
+            problem.objective = MDOFunction(lambda x: x.sum(), "f")
+            return problem
+
+        return create_problem
+
+    uniform = Problem(
+        "uniform",
+        create_creator("OTUniformDistribution", minimum=0.0, maximum=1.0),
+        doe_algo_name="OT_LHS",
+        doe_size=4,
+    )
+    triangular = Problem(
+        "triangular",
+        create_creator("OTTriangularDistribution", minimum=0.0, mode=0.9, maximum=1.0),
+        doe_algo_name="OT_LHS",
+        doe_size=4,
+    )
+    assert not numpy.array_equal(uniform.start_points, triangular.start_points)
+
+
 def test_undefined_start_points(creator):
     """Check the access to nonexistent starting points."""
     opt_problem = creator()
@@ -185,10 +267,10 @@ def test__get_description(
 
 
 @pytest.fixture
-def results():
+def results(results_mock):
     """Paths to performance histories."""
     paths = [Path(__file__).parent / "history.json"]
-    results = mock.Mock()
+    results = results_mock
     results.get_paths = mock.Mock(return_value=paths)
     return results
 
@@ -250,7 +332,12 @@ def test_plot_histories_single_target(
     baseline_images=["three_histories"], remove_text=True, extensions=["png"]
 )
 def test_plot_3_histories(
-    tmpdir, creator, target_values, algorithms_configurations, algorithm_configuration
+    tmpdir,
+    creator,
+    target_values,
+    algorithms_configurations,
+    algorithm_configuration,
+    results_mock,
 ):
     """Check the histories graph for three histories."""
     histories = [
@@ -263,7 +350,7 @@ def test_plot_3_histories(
         path = tmpdir / f"history_{index + 1}.json"
         history.to_file(path)
         paths.append(path)
-    results = mock.Mock()
+    results = results_mock
     results.get_paths = mock.Mock(return_value=paths)
     problem = Problem("problem", creator, target_values=target_values)
     pyplot.close("all")
@@ -275,7 +362,12 @@ def test_plot_3_histories(
     baseline_images=["infeasible_histories"], remove_text=True, extensions=["png"]
 )
 def test_plot_infeasible_histories(
-    tmpdir, creator, target_values, algorithms_configurations, algorithm_configuration
+    tmpdir,
+    creator,
+    target_values,
+    algorithms_configurations,
+    algorithm_configuration,
+    results_mock,
 ):
     """Check the histories graph for histories with infeasible items."""
     histories = [
@@ -288,7 +380,7 @@ def test_plot_infeasible_histories(
         path = tmpdir / f"history_{index + 1}.json"
         history.to_file(path)
         paths.append(path)
-    results = mock.Mock()
+    results = results_mock
     results.get_paths = mock.Mock(return_value=paths)
     problem = Problem("problem", creator, target_values=target_values)
     pyplot.close("all")
@@ -342,13 +434,18 @@ def test_plot_histories_max_eval_number(
     baseline_images=["logarithmic_histories"], remove_text=True, extensions=["png"]
 )
 def test_use_log_scale(
-    tmpdir, creator, target_values, algorithms_configurations, algorithm_configuration
+    tmpdir,
+    creator,
+    target_values,
+    algorithms_configurations,
+    algorithm_configuration,
+    results_mock,
 ):
     """Check the use of a logarithmic scale."""
     history = PerformanceHistory([1000, 100, 10, 1])
     path = tmpdir / "history.json"
     history.to_file(path)
-    results = mock.Mock()
+    results = results_mock
     results.get_paths = mock.Mock(return_value=[path])
     problem = Problem("problem", creator, target_values=TargetValues([100, 1]))
     pyplot.close("all")
@@ -506,3 +603,109 @@ def test_compute_data_profile_max_eval_number(
     bench_problem.compute_data_profile(
         algorithms_configurations, results, max_eval_number=4
     )
+
+
+@pytest.mark.parametrize("use_threading", [False, True])
+def test_compute_targets_in_parallel(algorithms_configurations, use_threading):
+    """Check the parallel computation of target values."""
+    problem = Problem(
+        "Rosenbrock", Rosenbrock, [numpy.array([0.0, 1.0]), numpy.array([1.0, 0.0])]
+    )
+    target_values = problem.compute_targets(2, algorithms_configurations)
+    parallel_target_values = problem.compute_targets(
+        2,
+        algorithms_configurations,
+        number_of_processes=2,
+        use_threading=use_threading,
+    )
+    assert parallel_target_values.objective_values == target_values.objective_values
+
+
+@pytest.mark.parametrize("use_threading", [False, True])
+def test_compute_targets_in_parallel_failure(algorithms_configurations, use_threading):
+    """Check that the failure of a reference algorithm run in parallel is raised."""
+    problem = Problem(
+        "Rosenbrock", Rosenbrock, [numpy.array([0.0, 1.0]), numpy.array([1.0, 0.0])]
+    )
+    with (
+        mock.patch(
+            "gemseo_benchmark.problems.problem.execute_algo",
+            side_effect=ValueError("The reference algorithm failed."),
+        ),
+        pytest.raises(ValueError, match="The reference algorithm failed."),
+    ):
+        problem.compute_targets(
+            2,
+            algorithms_configurations,
+            number_of_processes=2,
+            use_threading=use_threading,
+        )
+
+
+def test_compute_targets_cached_reference_histories(
+    tmp_path, algorithms_configurations
+):
+    """Check the caching of the performance histories of the reference algorithms."""
+    problem = Problem(
+        "Rosenbrock", Rosenbrock, [numpy.array([0.0, 1.0]), numpy.array([1.0, 0.0])]
+    )
+    target_values = problem.compute_targets(
+        2, algorithms_configurations, reference_histories_path=tmp_path
+    )
+    assert len(list((tmp_path / "Rosenbrock").iterdir())) == 2
+    with mock.patch("gemseo_benchmark.problems.problem.execute_algo") as execute_algo:
+        cached_target_values = problem.compute_targets(
+            2, algorithms_configurations, reference_histories_path=tmp_path
+        )
+
+    execute_algo.assert_not_called()
+    assert cached_target_values.objective_values == target_values.objective_values
+
+
+def test_compute_targets_from_results(tmp_path, algorithms_configurations):
+    """Check the computation of target values from existing performance histories."""
+    problem = Problem(
+        "Rosenbrock", Rosenbrock, [numpy.array([0.0, 1.0]), numpy.array([1.0, 0.0])]
+    )
+    target_values = problem.compute_targets(
+        2, algorithms_configurations, reference_histories_path=tmp_path
+    )
+    results = Results()
+    configuration_name = algorithms_configurations.names[0]
+    for path in (tmp_path / "Rosenbrock").iterdir():
+        results.add_path(configuration_name, "Rosenbrock", path)
+
+    with mock.patch("gemseo_benchmark.problems.problem.execute_algo") as execute_algo:
+        reused_target_values = problem.compute_targets(
+            2, algorithms_configurations, results=results
+        )
+
+    execute_algo.assert_not_called()
+    assert reused_target_values.objective_values == target_values.objective_values
+
+
+def test_compute_targets_cached_large_array_options(tmp_path):
+    """Check that large array options differing in the middle have distinct caches."""
+    problem = Problem("Rosenbrock", Rosenbrock, [numpy.array([0.0, 1.0])])
+    array_option = numpy.zeros(2000)
+    other_array_option = array_option.copy()
+    other_array_option[1000] = 1.0
+    assert repr(array_option) == repr(other_array_option)
+    configurations = []
+    for index, value in enumerate([array_option, other_array_option]):
+        configuration = mock.Mock()
+        configuration.name = f"SLSQP {index}"
+        configuration.algorithm_name = "SLSQP"
+        configuration.algorithm_options = {"max_iter": 3, "array_option": value}
+        configurations.append(configuration)
+
+    def execute_algo_without_array_option(*args, array_option, **kwargs):
+        return execute_algo(*args, **kwargs)
+
+    with mock.patch(
+        "gemseo_benchmark.problems.problem.execute_algo",
+        side_effect=execute_algo_without_array_option,
+    ):
+        problem.compute_targets(2, configurations, reference_histories_path=tmp_path)
+
+    assert len(list((tmp_path / "Rosenbrock").iterdir())) == 2
@@ -62,6 +62,17 @@ def test_compute_targets():
     assert isinstance(rosenbrock.target_values, TargetValues)
 
 
+def test_compute_targets_cached_reference_histories(tmp_path):
+    """Check the caching of the reference histories of a group of problems."""
+    rosenbrock = Problem("Rosenbrock", Rosenbrock, [zeros(2)])
+    other_rosenbrock = Problem("Other Rosenbrock", Rosenbrock, [zeros(2)])
+    ProblemsGroup("group", [rosenbrock, other_rosenbrock]).compute_targets(
+        2, algorithms_configurations, reference_histories_path=tmp_path
+    )
+    assert len(list((tmp_path / "Rosenbrock").iterdir())) == 1
+    assert len(list((tmp_path / "Other_Rosenbrock").iterdir())) == 1
+
+
 @image_comparison(
     baseline_images=["data_profile"], remove_text=True, extensions=["png"]
 )
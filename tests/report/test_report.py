@@ -172,10 +172,14 @@ def test_problem_without_optimum(
 
 @pytest.fixture
 def incomplete_results(
-    algorithm_configuration, unknown_algorithm_configuration, problem_a, problem_b
+    algorithm_configuration,
+    unknown_algorithm_configuration,
+    problem_a,
+    problem_b,
+    results_mock,
 ) -> mock.Mock:
     """The results of the benchmarking."""
-    results = mock.Mock()
+    results = results_mock
     results.algorithms = [
         algorithm_configuration.name,
         unknown_algorithm_configuration.name,
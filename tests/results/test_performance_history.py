@@ -21,6 +21,7 @@
 
 from __future__ import annotations
 
+import json
 import re
 from pathlib import Path
 from unittest import mock
@@ -61,6 +62,15 @@ def test_negative_infeasibility_measures():
         PerformanceHistory([3.0, 2.0], [1.0, -1.0])
 
 
+def test_negative_n_unsatisfied_constraints():
+    """Check the initialization of a history with a negative number of unsatisfied
+    constraints."""
+    with pytest.raises(
+        ValueError, match=r"The number of unsatisfied constraints is negative: -1\."
+    ):
+        PerformanceHistory([3.0, 2.0], [1.0, 0.0], n_unsatisfied_constraints=[-1, 0])
+
+
 def test_length():
     """Check the length of a performance history."""
     history_1 = PerformanceHistory([3.0, 2.0])
@@ -128,6 +138,25 @@ history_2 = PerformanceHistory([-2.0, -2.0, 2.0], [0.0, 3.0, 0.0])
 history_3 = PerformanceHistory([3.0, -3.0, 3.0], [0.0, 0.0, 0.0])
 
 
+def test_is_lower_or_equal():
+    """Check the comparison of a history with a history item or another history."""
+    history = PerformanceHistory([1.0, 2.0, 0.0], [0.0, 0.0, 1.0])
+    other = PerformanceHistory([1.0, 3.0], [0.0, 1.0])
+    assert history.is_lower_or_equal(other).tolist() == [
+        [True, True],
+        [False, True],
+        [False, True],
+    ]
+    assert history.is_lower_or_equal(other).tolist() == [
+        [item <= other_item for other_item in other] for item in history
+    ]
+    assert history.is_lower_or_equal(HistoryItem(2.0, 0.0)).tolist() == [
+        True,
+        True,
+        False,
+    ]
+
+
 def test_compute_minimum_history():
     """Check the computation of the minimum history."""
     items = [HistoryItem(-2.0, 0.0), HistoryItem(-3.0, 0.0), HistoryItem(2.0, 0.0)]
@@ -220,6 +249,22 @@ def test_from_file():
     assert history.items[1].n_unsatisfied_constraints == 0
 
 
+def test_from_deprecated_file(tmp_path):
+    """Check the initialization of a performance history from a deprecated file."""
+    file_path = tmp_path / "history.json"
+    file_path.write_text(
+        json.dumps([
+            {"performance": -2.0, "infeasibility": 1.0},
+            {"performance": -3.0, "infeasibility": 0.0},
+        ])
+    )
+    history = PerformanceHistory.from_file(file_path)
+    assert history.problem_name is None
+    assert history.objective_values == [-2.0, -3.0]
+    assert history.infeasibility_measures == [1.0, 0.0]
+    assert history.n_unsatisfied_constraints == [None, 0]
+
+
 def test_history_items_setter():
     """Check the setting of history items."""
     history = PerformanceHistory()
@@ -227,6 +272,28 @@ def test_history_items_setter():
         history.items = [1.0, 2.0]
 
 
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda items: items.__setitem__(0, HistoryItem(3.0, 0.0)),
+        lambda items: items.append(HistoryItem(4.0, 0.0)),
+        lambda items: items.extend([HistoryItem(4.0, 0.0)]),
+        lambda items: items.pop(),
+    ],
+)
+def test_history_items_read_only(modify):
+    """Check that the list of history items cannot be modified in place."""
+    history = PerformanceHistory([1.0, 2.0], [0.0, 0.0])
+    with pytest.raises(
+        TypeError, match=r"The history items cannot be modified in place; "
+    ):
+        modify(history.items)
+
+    assert history.objective_values == [1.0, 2.0]
+    history.items = [HistoryItem(3.0, 0.0), *history.items[1:]]
+    assert history.objective_values == [3.0, 2.0]
+
+
 def test_repr():
     """Check the representation of a performance history."""
     history = PerformanceHistory([-2.0, -3.0], [1.0, 0.0])
@@ -295,3 +362,35 @@ def test_get_plot_data_feasible():
     """Check the retrieval of feasible data for plotting."""
     history = PerformanceHistory([2.0, 1.0], [1.0, 1.0])
     assert history.get_plot_data(feasible=True) == ([], [])
+
+
+def test_inconsistent_n_unsatisfied_constraints():
+    """Check the initialization of a history with inconsistent constraints data."""
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "The infeasibility measure (1.0) and the number of unsatisfied "
+            "constraints (0) are not consistent."
+        ),
+    ):
+        PerformanceHistory([3.0, 2.0], [0.0, 1.0], n_unsatisfied_constraints=[0, 0])
+
+
+def test_getitem(performance_history):
+    """Check the access to the items of a performance history."""
+    assert performance_history[1] == HistoryItem(-3.0, 3.0, 6)
+    assert performance_history[1].n_unsatisfied_constraints == 6
+    assert performance_history[-1] == HistoryItem(-1.0, 0.0, 0)
+    assert performance_history[4:] == [HistoryItem(1.0, 0.0), HistoryItem(-1.0, 0.0)]
+
+
+def test_apply_infeasibility_tolerance():
+    """Check that applying a tolerance does not alter the copies of a history."""
+    history = PerformanceHistory(
+        [3.0, 2.0], [2.0, 1.0], n_unsatisfied_constraints=[2, 1]
+    )
+    shortening = history.shorten(2)
+    history.apply_infeasibility_tolerance(1.0)
+    assert history.items == [HistoryItem(3.0, 2.0, 2), HistoryItem(2.0, 0.0, 0)]
+    assert history.n_unsatisfied_constraints == [2, 0]
+    assert shortening.items == [HistoryItem(3.0, 2.0, 2), HistoryItem(2.0, 1.0, 1)]
@@ -22,10 +22,14 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
+from gemseo_benchmark.results.history_item import HistoryItem
+from gemseo_benchmark.results.performance_history import PerformanceHistory
 from gemseo_benchmark.results.results import Results
 
 algorithm_name = "algorithm"
@@ -143,3 +147,53 @@ def test_get_paths_unknown_problem(results):
 def test_contains(results, algorithm, problem, path, contained):
     """Check the membership assessment of a history path to the results."""
     assert results.contains(algorithm, problem, path) == contained
+
+
+def test_get_history(tmp_path):
+    """Check that a performance history file is read only once unless modified."""
+    path = tmp_path / "history.json"
+    PerformanceHistory([2.0, 1.0], [0.0, 0.0], objective_name="f").to_file(path)
+    results = Results()
+    results.add_path(algorithm_name, problem_name, path)
+    with mock.patch.object(
+        PerformanceHistory, "from_file", wraps=PerformanceHistory.from_file
+    ) as from_file:
+        history = results.get_history(path)
+        history.apply_infeasibility_tolerance(1.0)
+        history.items = [HistoryItem(0.0, 0.0)]
+        assert results.get_history(path).objective_values == [2.0, 1.0]
+        assert from_file.call_count == 1
+
+        PerformanceHistory([3.0], [0.0], objective_name="f").to_file(path)
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        assert results.get_history(path).objective_values == [3.0]
+        assert from_file.call_count == 2
+
+        # Rewrite the file without changing its modification time.
+        modification_time = path.stat().st_mtime_ns
+        PerformanceHistory([4.0, 5.0], [0.0, 0.0], objective_name="f").to_file(path)
+        os.utime(path, ns=(0, modification_time))
+        assert results.get_history(path).objective_values == [4.0, 5.0]
+        assert from_file.call_count == 3
+
+
+def test_get_history_cache_size(tmp_path):
+    """Check that only the most recently used performance histories are kept."""
+    paths = [tmp_path / f"history_{index}.json" for index in range(3)]
+    for index, path in enumerate(paths):
+        PerformanceHistory([float(index)], [0.0], objective_name="f").to_file(path)
+
+    results = Results(histories_cache_size=2)
+    with mock.patch.object(
+        PerformanceHistory, "from_file", wraps=PerformanceHistory.from_file
+    ) as from_file:
+        results.get_history(paths[0])
+        results.get_history(paths[1])
+        results.get_history(paths[0])
+        results.get_history(paths[2])
+        assert from_file.call_count == 3
+        # The second history was the least recently used one.
+        results.get_history(paths[0])
+        assert from_file.call_count == 3
+        assert results.get_history(paths[1]).objective_values == [1.0]
+        assert from_file.call_count == 4